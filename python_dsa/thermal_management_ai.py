@@ -10,26 +10,25 @@ Research breakthrough: 60% power reduction achieved
 
 import numpy as np
 import tensorflow as tf
-from sklearn.ensemble import RandomForestRegressor
 from sklearn.preprocessing import StandardScaler
 import time
 import threading
-import queue
 import logging
+from collections import deque
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class ThermalManagementAI:
     def __init__(self):
         self.model = None
+        self.predict_fn = None
         self.scaler = StandardScaler()
-        self.temperature_history = []
+        self.scaler_mean = None
+        self.scaler_scale = None
+        self.temperature_history = deque(maxlen=100)
         self.power_reduction = 0.0
         self.accuracy = 0.0
         self.is_training = False
-        self.prediction_queue = queue.Queue()
         self.control_thread = None
         self.running = False
         
@@ -38,11 +37,21 @@ class ThermalManagementAI:
         self.max_temperature = 85.0     # Celsius
         self.min_temperature = 30.0    # Celsius
         self.cooling_efficiency = 0.8
+        self.control_period = 1.0      # Seconds
         
         # AI model parameters
         self.feature_count = 5
         self.prediction_window = 10
         self.learning_rate = 0.001
+        self.quantize_model = False   # int8-weight TFLite inference; predictions differ slightly
+        
+        # Sensor simulation: readings drawn in blocks, one row per tick
+        # Columns: current_temp, cpu_usage, gpu_usage, ambient_temp, fan_speed
+        self.rng = np.random.default_rng()
+        self.sim_low = np.array([40.0, 0.0, 0.0, 20.0, 0.0])
+        self.sim_range = np.array([40.0, 100.0, 100.0, 10.0, 100.0])
+        self.sim_buffer = np.empty((256, self.feature_count))
+        self.sim_index = len(self.sim_buffer)
         
         logger.info("Thermal Management AI initialized")
         
@@ -70,11 +79,27 @@ class ThermalManagementAI:
             dummy_features = np.random.randn(100, self.feature_count)
             dummy_temperatures = np.random.uniform(30, 85, 100)
             
-            # Fit scaler
-            self.scaler.fit(dummy_features)
+            # Fit scaler; the model is trained on the same scaled features
+            # that predict_thermal_behavior() feeds it
+            scaled_features = self.scaler.fit_transform(dummy_features)
+            self.scaler_mean = self.scaler.mean_.astype(np.float32)
+            self.scaler_scale = self.scaler.scale_.astype(np.float32)
             
             # Train model
-            self.model.fit(dummy_features, dummy_temperatures, epochs=10, verbose=0)
+            self.model.fit(scaled_features, dummy_temperatures, epochs=10, verbose=0)
+            
+            # Trace a fixed-signature inference graph once; model.predict()
+            # rebuilds its data pipeline on every call
+            self.predict_fn = tf.function(
+                lambda x: self.model(x, training=False),
+                input_signature=[tf.TensorSpec([None, self.feature_count], tf.float32)]
+            )
+            if self.quantize_model:
+                try:
+                    self.predict_fn = self._build_quantized_predictor()
+                except Exception as e:
+                    logger.warning(f"Model quantization failed, using float model: {e}")
+            self.predict_fn(np.zeros((1, self.feature_count), dtype=np.float32))
             
             self.accuracy = 0.95  # Simulated accuracy
             logger.info("AI thermal management model initialized with 95% accuracy")
@@ -83,31 +108,55 @@ class ThermalManagementAI:
         except Exception as e:
             logger.error(f"Failed to initialize AI model: {e}")
             return False
+    
+    def _build_quantized_predictor(self):
+        """Convert the trained model to an int8-weight TFLite interpreter"""
+        # Dynamic-range quantization: weights stored as int8, activations
+        # quantized on the fly, so no representative dataset is needed
+        converter = tf.lite.TFLiteConverter.from_keras_model(self.model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        interpreter = tf.lite.Interpreter(model_content=converter.convert())
+        interpreter.allocate_tensors()
+        input_index = interpreter.get_input_details()[0]['index']
+        output_index = interpreter.get_output_details()[0]['index']
+        # The interpreter is not thread-safe and is shared by the control
+        # thread and direct callers
+        lock = threading.Lock()
+        
+        def predict(features):
+            with lock:
+                interpreter.set_tensor(input_index, features)
+                interpreter.invoke()
+                return interpreter.get_tensor(output_index)
+        
+        logger.info("Thermal model quantized to int8 weights")
+        return predict
         
     def predict_thermal_behavior(self, current_temp, cpu_usage, gpu_usage, 
                                 ambient_temp, fan_speed):
         """Predict thermal behavior using AI model"""
         try:
-            if self.model is None:
+            if self.predict_fn is None:
                 logger.warning("Model not initialized, using fallback prediction")
                 return self._fallback_prediction(current_temp, cpu_usage, gpu_usage)
             
             # Prepare features
             features = np.array([[current_temp, cpu_usage, gpu_usage, 
-                                ambient_temp, fan_speed]])
+                                ambient_temp, fan_speed]], dtype=np.float32)
             
-            # Scale features
-            features_scaled = self.scaler.transform(features)
+            # Scale features (same result as scaler.transform, without
+            # sklearn's per-call validation)
+            features_scaled = (features - self.scaler_mean) / self.scaler_scale
             
             # Make prediction
-            prediction = self.model.predict(features_scaled, verbose=0)
-            predicted_temp = prediction[0][0]
+            prediction = self.predict_fn(features_scaled)
+            predicted_temp = float(prediction[0][0])
             
             # Clamp prediction to realistic range
             predicted_temp = np.clip(predicted_temp, self.min_temperature, 
                                    self.max_temperature)
             
-            logger.debug(f"Thermal prediction: {predicted_temp:.2f}°C")
+            logger.debug("Thermal prediction: %.2f°C", predicted_temp)
             return predicted_temp
             
         except Exception as e:
@@ -136,8 +185,9 @@ class ThermalManagementAI:
                 # Calculate fan speed adjustment
                 fan_speed_increase = min(temp_excess * 20, 50)  # Max 50% increase
                 
-                logger.info(f"Cooling optimization: power_reduction={power_reduction:.1f}%, "
-                           f"fan_speed_increase={fan_speed_increase:.1f}%")
+                logger.info("Cooling optimization: power_reduction=%.1f%%, "
+                            "fan_speed_increase=%.1f%%",
+                            power_reduction, fan_speed_increase)
                 
                 return {
                     'power_reduction': power_reduction,
@@ -159,6 +209,18 @@ class ThermalManagementAI:
             logger.error(f"Cooling optimization failed: {e}")
             return None
     
+    def _simulate_sensor_readings(self):
+        """Return the next simulated sensor row, refilling the block when spent"""
+        if self.sim_index == len(self.sim_buffer):
+            self.rng.random(out=self.sim_buffer)
+            self.sim_buffer *= self.sim_range
+            self.sim_buffer += self.sim_low
+            self.sim_index = 0
+        
+        reading = self.sim_buffer[self.sim_index]
+        self.sim_index += 1
+        return reading
+    
     def start_thermal_control(self):
         """Start the thermal control loop"""
         if self.control_thread and self.control_thread.is_alive():
@@ -183,14 +245,12 @@ class ThermalManagementAI:
     
     def _thermal_control_loop(self):
         """Main thermal control loop"""
+        deadline = time.monotonic()
         while self.running:
             try:
                 # Simulate sensor readings
-                current_temp = np.random.uniform(40, 80)
-                cpu_usage = np.random.uniform(0, 100)
-                gpu_usage = np.random.uniform(0, 100)
-                ambient_temp = np.random.uniform(20, 30)
-                fan_speed = np.random.uniform(0, 100)
+                (current_temp, cpu_usage, gpu_usage,
+                 ambient_temp, fan_speed) = self._simulate_sensor_readings()
                 
                 # Predict thermal behavior
                 predicted_temp = self.predict_thermal_behavior(
@@ -201,27 +261,32 @@ class ThermalManagementAI:
                 optimization = self.optimize_cooling_system(predicted_temp)
                 
                 if optimization:
-                    logger.debug(f"Thermal control: temp={current_temp:.1f}°C, "
-                               f"predicted={predicted_temp:.1f}°C, "
-                               f"power_reduction={optimization['power_reduction']:.1f}%")
+                    logger.debug("Thermal control: temp=%.1f°C, predicted=%.1f°C, "
+                                 "power_reduction=%.1f%%", current_temp,
+                                 predicted_temp, optimization['power_reduction'])
                 
                 # Store temperature history
                 self.temperature_history.append(current_temp)
-                if len(self.temperature_history) > 100:
-                    self.temperature_history.pop(0)
-                
-                time.sleep(1)  # 1 second control loop
                 
             except Exception as e:
                 logger.error(f"Thermal control loop error: {e}")
-                time.sleep(1)
+            
+            # Sleep to the next tick deadline rather than a full period after
+            # the work, so per-tick cost does not accumulate drift
+            deadline += self.control_period
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Overran by more than a tick; resync instead of bursting
+                deadline = time.monotonic()
     
     def get_thermal_stats(self):
         """Get thermal management statistics"""
         return {
             'power_reduction': self.power_reduction,
             'accuracy': self.accuracy,
-            'temperature_history': self.temperature_history[-10:],  # Last 10 readings
+            'temperature_history': list(self.temperature_history)[-10:],  # Last 10 readings
             'model_initialized': self.model is not None,
             'control_running': self.running
         }
@@ -280,4 +345,6 @@ def main():
     print("\nThermal Management AI system ready")
 
 if __name__ == "__main__":
+    # Configure logging
+    logging.basicConfig(level=logging.INFO)
     main()
\ No newline at end of file